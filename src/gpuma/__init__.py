@@ -29,6 +29,7 @@ from .config import (
 )
 from .decorators import time_it, timed_block
 from .io_handler import (
+    iter_multi_xyz,
     read_multi_xyz,
     read_xyz,
     read_xyz_directory,
@@ -44,6 +45,7 @@ from .models import (
     load_calculator,
     load_torchsim_model,
 )
+from .mol_utils import clear_smiles_cache
 from .optimizer import optimize_single_structure, optimize_structure_batch
 from .structure import Structure
 
@@ -53,12 +55,14 @@ __all__ = [
     # I/O functions
     "read_xyz",
     "read_multi_xyz",
+    "iter_multi_xyz",
     "read_xyz_directory",
     "smiles_to_xyz",
     "smiles_to_ensemble",
     "save_xyz_file",
     "save_multi_xyz",
     "save_as_single_xyz_files",
+    "clear_smiles_cache",
     # Optimization functions
     "optimize_single_structure",
     "optimize_structure_batch",
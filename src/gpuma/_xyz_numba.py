@@ -0,0 +1,314 @@
+"""Optional Numba-accelerated parser for multi-structure XYZ files.
+
+The kernel scans the raw file bytes once and writes atom data straight into
+preallocated NumPy arrays, so no Python objects are created per atom. It only
+handles well-formed input: whenever a file needs the recovery logic of the
+pure-Python reader (truncated frames, malformed atom lines, unusual line
+breaks or whitespace), :func:`parse_multi_xyz` returns ``None`` and the caller
+falls back to that reader. Results are identical to the pure-Python path.
+
+:mod:`numba` is an optional dependency (``pip install 'gpuma[fast]'``).
+"""
+
+from __future__ import annotations
+
+import sys
+
+import numpy as np
+
+from .structure import Structure
+
+try:
+    import numba
+except ImportError:  # pragma: no cover - optional dependency
+    numba = None
+
+NUMBA_AVAILABLE = numba is not None
+
+# Kernel status codes
+_OK = 0
+_FALLBACK = 1
+
+# Powers of ten that are exactly representable as float64
+_POW10 = np.array([10.0**i for i in range(23)], dtype=np.float64)
+
+# Symbols are packed little-endian into an int64 key, one byte per character
+_MAX_SYMBOL_BYTES = 7
+
+
+if NUMBA_AVAILABLE:
+
+    @numba.njit(cache=True, inline="always")
+    def _is_space(c):
+        # ASCII whitespace of str.split(): " ", "\t", "\v", "\f", "\r", "\x1c"-"\x1f"
+        return c == 32 or 9 <= c <= 13 or 28 <= c <= 31
+
+    @numba.njit(cache=True)
+    def _parse_float(buf, start, end, pow10):
+        """Parse ``buf[start:end]`` as a decimal float.
+
+        Only inputs whose result is provably identical to :func:`float` are
+        handled (Clinger's fast path: mantissa <= 2**53, ``|exp10| <= 22``).
+        Returns ``(value, ok)``; ``ok`` is ``False`` for anything else.
+        """
+        i = start
+        negative = False
+        if buf[i] == 45 or buf[i] == 43:
+            negative = buf[i] == 45
+            i += 1
+
+        mantissa = 0
+        n_significant = 0
+        n_digits = 0
+        exp10 = 0
+
+        while i < end and 48 <= buf[i] <= 57:
+            if mantissa != 0 or buf[i] != 48:
+                n_significant += 1
+                if n_significant > 18:
+                    return 0.0, False
+            mantissa = mantissa * 10 + (buf[i] - 48)
+            n_digits += 1
+            i += 1
+        if i < end and buf[i] == 46:
+            i += 1
+            while i < end and 48 <= buf[i] <= 57:
+                if mantissa != 0 or buf[i] != 48:
+                    n_significant += 1
+                    if n_significant > 18:
+                        return 0.0, False
+                mantissa = mantissa * 10 + (buf[i] - 48)
+                exp10 -= 1
+                n_digits += 1
+                i += 1
+        if n_digits == 0:
+            return 0.0, False
+
+        if i < end and (buf[i] == 101 or buf[i] == 69):
+            i += 1
+            exp_negative = False
+            if i < end and (buf[i] == 45 or buf[i] == 43):
+                exp_negative = buf[i] == 45
+                i += 1
+            exp_value = 0
+            n_exp_digits = 0
+            while i < end and 48 <= buf[i] <= 57:
+                exp_value = exp_value * 10 + (buf[i] - 48)
+                n_exp_digits += 1
+                if n_exp_digits > 4:
+                    return 0.0, False
+                i += 1
+            if n_exp_digits == 0:
+                return 0.0, False
+            exp10 += -exp_value if exp_negative else exp_value
+
+        if i != end or mantissa > 9007199254740992:
+            return 0.0, False
+
+        if mantissa == 0:
+            value = 0.0
+        elif 0 <= exp10 <= 22:
+            value = mantissa * pow10[exp10]
+        elif -22 <= exp10 < 0:
+            value = mantissa / pow10[-exp10]
+        else:
+            return 0.0, False
+        return (-value if negative else value), True
+
+    @numba.njit(cache=True)
+    def _scan_multi_xyz(buf, pow10, frames, line_starts, symbol_keys, coords, slow):
+        """Scan a multi-XYZ byte buffer into the preallocated output arrays.
+
+        ``frames`` rows are ``(first_atom, n_atoms, comment_start, comment_end)``.
+        Coordinates that :func:`_parse_float` cannot handle are recorded in
+        ``slow`` as flat indices into ``coords`` and left for the caller.
+
+        Returns ``(status, n_frames, n_atoms, n_slow)``.
+        """
+        n = buf.shape[0]
+        pos = 0
+        n_frames = 0
+        n_atoms = 0
+        n_slow = 0
+
+        while pos < n:
+            start = pos
+            end = start
+            while end < n and buf[end] != 10:
+                end += 1
+            pos = end + 1
+
+            while start < end and _is_space(buf[start]):
+                start += 1
+            while end > start and _is_space(buf[end - 1]):
+                end -= 1
+            if start == end:
+                continue
+
+            # Atom count line; anything that is not a plain integer is skipped
+            j = start
+            negative = False
+            if buf[j] == 45 or buf[j] == 43:
+                negative = buf[j] == 45
+                j += 1
+            count = 0
+            is_int = j < end
+            while j < end:
+                c = buf[j]
+                if c < 48 or c > 57:
+                    is_int = False
+                    break
+                count = count * 10 + (c - 48)
+                if j - start > 17:
+                    return _FALLBACK, 0, 0, 0
+                j += 1
+            if not is_int:
+                for k in range(start, end):
+                    # int() also accepts underscores and non-ASCII digits
+                    if buf[k] == 95 or buf[k] >= 128:
+                        return _FALLBACK, 0, 0, 0
+                continue
+            if negative:
+                count = -count
+
+            if pos >= n:
+                break
+            comment_start = pos
+            comment_end = comment_start
+            while comment_end < n and buf[comment_end] != 10:
+                comment_end += 1
+            pos = comment_end + 1
+            if comment_end > comment_start and buf[comment_end - 1] == 13:
+                comment_end -= 1
+
+            if count < 0:
+                continue
+
+            first_atom = n_atoms
+            for _ in range(count):
+                if pos >= n:
+                    return _FALLBACK, 0, 0, 0
+                start = pos
+                end = start
+                while end < n and buf[end] != 10:
+                    end += 1
+                pos = end + 1
+                line_starts[n_atoms] = start
+
+                k = start
+                for column in range(4):
+                    while k < end and _is_space(buf[k]):
+                        k += 1
+                    if k == end:
+                        return _FALLBACK, 0, 0, 0
+                    token_start = k
+                    while k < end and not _is_space(buf[k]):
+                        if buf[k] >= 128:
+                            return _FALLBACK, 0, 0, 0
+                        k += 1
+
+                    if column == 0:
+                        if k - token_start > _MAX_SYMBOL_BYTES:
+                            return _FALLBACK, 0, 0, 0
+                        key = 0
+                        for m in range(token_start, k):
+                            key |= np.int64(buf[m]) << (8 * (m - token_start))
+                        symbol_keys[n_atoms] = key
+                    else:
+                        value, ok = _parse_float(buf, token_start, k, pow10)
+                        if not ok:
+                            slow[n_slow] = 3 * n_atoms + column - 1
+                            n_slow += 1
+                        coords[n_atoms, column - 1] = value
+                n_atoms += 1
+
+            frames[n_frames, 0] = first_atom
+            frames[n_frames, 1] = count
+            frames[n_frames, 2] = comment_start
+            frames[n_frames, 3] = comment_end
+            n_frames += 1
+
+        return _OK, n_frames, n_atoms, n_slow
+
+
+def parse_multi_xyz(data: bytes, charge: int, multiplicity: int) -> list[Structure] | None:
+    """Parse the raw bytes of a multi-structure XYZ file with the Numba kernel.
+
+    Parameters
+    ----------
+    data:
+        Complete file contents.
+    charge:
+        Total charge to set on all returned structures.
+    multiplicity:
+        Spin multiplicity to set on all returned structures.
+
+    Returns
+    -------
+    list[Structure] | None
+        Parsed structures, or ``None`` if Numba is unavailable or the file
+        needs the pure-Python reader. Each structure owns its coordinates;
+        the scratch array sized by the file's line count is not kept alive.
+
+    Raises
+    ------
+    UnicodeDecodeError
+        If the file is not valid UTF-8.
+
+    """
+    if not NUMBA_AVAILABLE:
+        return None
+    if data.count(b"\r") != data.count(b"\r\n"):
+        return None
+    if not data.isascii():
+        # Fail on invalid UTF-8 exactly like the pure-Python reader
+        data.decode("utf-8")
+
+    buf = np.frombuffer(data, dtype=np.uint8)
+    max_lines = data.count(b"\n") + 1
+    frames = np.empty((max_lines // 2 + 1, 4), dtype=np.int64)
+    line_starts = np.empty(max_lines, dtype=np.int64)
+    symbol_keys = np.empty(max_lines, dtype=np.int64)
+    coords = np.empty((max_lines, 3), dtype=np.float64)
+    slow = np.empty(3 * max_lines, dtype=np.int64)
+
+    status, n_frames, n_atoms, n_slow = _scan_multi_xyz(
+        buf, _POW10, frames, line_starts, symbol_keys, coords, slow
+    )
+    if status != _OK:
+        return None
+
+    flat = coords.reshape(-1)
+    for index in slow[:n_slow].tolist():
+        atom, column = divmod(index, 3)
+        start = int(line_starts[atom])
+        end = data.find(b"\n", start)
+        line = data[start:] if end < 0 else data[start:end]
+        try:
+            flat[index] = float(line.decode("utf-8").split()[column + 1])
+        except ValueError:
+            return None
+
+    keys, inverse = np.unique(symbol_keys[:n_atoms], return_inverse=True)
+    unique_symbols = np.array(
+        [
+            sys.intern(int(key).to_bytes(8, "little").rstrip(b"\0").decode("ascii"))
+            for key in keys.tolist()
+        ],
+        dtype=object,
+    )
+    symbols = unique_symbols[inverse.reshape(-1)]
+
+    structures: list[Structure] = []
+    for first_atom, count, comment_start, comment_end in frames[:n_frames].tolist():
+        stop = first_atom + count
+        structures.append(
+            Structure(
+                symbols=symbols[first_atom:stop].tolist(),
+                coordinates=coords[first_atom:stop].copy(),
+                comment=data[comment_start:comment_end].decode("utf-8"),
+                charge=charge,
+                multiplicity=multiplicity,
+            )
+        )
+    return structures
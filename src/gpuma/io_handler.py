@@ -6,10 +6,19 @@ formats and converting between different representations.
 
 from __future__ import annotations
 
-import glob
 import logging
+import mmap
 import os
+import sys
+from array import array
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
 
+import numpy as np
+
+from ._xyz_numba import NUMBA_AVAILABLE as _NUMBA_AVAILABLE
+from ._xyz_numba import parse_multi_xyz as _parse_multi_xyz_numba
+from .mol_utils import _canonical_smiles
 from .mol_utils import (
     smiles_to_conformer_ensemble as _smiles_to_ensemble_util,
 )
@@ -20,6 +29,103 @@ from .structure import Structure
 
 logger = logging.getLogger(__name__)
 
+# Multi-XYZ files at least this large are parsed with the Numba kernel when
+# numba is installed. Loading the compiled kernel costs ~0.2-0.3 s once per
+# process, even from the on-disk cache; below this size the pure-Python reader
+# finishes sooner on a cold first call.
+_NUMBA_MIN_BYTES = 16 << 20
+
+# iter_multi_xyz memory-maps files at least this large; smaller files are
+# cheaper to read into memory in one call.
+_MMAP_MIN_BYTES = 100 << 20
+
+# Template for preallocating float64 coordinate buffers by repetition
+_ZERO_DOUBLE = array("d", [0.0])
+
+# read_xyz_directory only starts a thread pool for at least this many files;
+# for fewer, thread start-up costs more than overlapping file access saves.
+_PARALLEL_MIN_FILES = 64
+
+
+def _split_lines(text: str) -> list[str]:
+    """Split decoded text into lines like a file opened in text mode.
+
+    Only ``"\\n"``, ``"\\r\\n"`` and ``"\\r"`` end a line (universal newlines).
+    Unlike :meth:`str.splitlines`, form feeds, ``"\\x85"``, U+2028 and other
+    Unicode separators stay part of the line, so free-text comments that
+    contain them are preserved.
+    """
+    if "\r" in text:
+        text = text.replace("\r\n", "\n").replace("\r", "\n")
+    lines = text.split("\n")
+    if not lines[-1]:
+        lines.pop()
+    return lines
+
+
+def _read_lines(file_path: str) -> list[str]:
+    """Read a text file in one call and split it into lines.
+
+    The file is read in binary mode and decoded once, then split with
+    :func:`_split_lines`, which avoids per-line iteration and the trailing
+    newline stripping of ``readlines()``.
+    """
+    with open(file_path, "rb") as fh:
+        return _split_lines(fh.read().decode("utf-8"))
+
+
+def _parse_atom_block(lines: list[str], num_atoms: int) -> tuple[list[str], np.ndarray]:
+    """Parse the atom lines (``symbol x y z``) of a single-structure XYZ file.
+
+    Symbols and coordinate values are collected in a single pass with bound
+    ``append``/``extend`` methods, and the flat value list is converted to the
+    ``(N, 3)`` array in one call. Columns beyond ``z`` are ignored.
+
+    Parameters
+    ----------
+    lines:
+        Atom lines (without trailing newlines), starting at file line 3.
+    num_atoms:
+        Number of atom lines expected.
+
+    Returns
+    -------
+    tuple[list[str], numpy.ndarray]
+        Atomic symbols (interned, so repeated elements share one string) and
+        the ``(N, 3)`` coordinate array.
+
+    Raises
+    ------
+    ValueError
+        If a line is malformed or fewer than ``num_atoms`` lines are available.
+
+    """
+    symbols: list[str] = []
+    values: list[float] = []
+    add_symbol = symbols.append
+    add_values = values.extend
+    for line in lines[:num_atoms]:
+        # At most 4 splits: columns after z stay joined in parts[4]
+        parts = line.split(None, 4)
+        # len(symbols) is the index of the current atom; atom lines start at line 3
+        if len(parts) < 4:
+            raise ValueError(
+                f"Line {len(symbols) + 3} must contain at least 4 elements: symbol x y z"
+            )
+        try:
+            add_values((float(parts[1]), float(parts[2]), float(parts[3])))
+        except ValueError as exc:
+            raise ValueError(
+                f"Invalid coordinates in line {len(symbols) + 3}: {parts[1:4]}"
+            ) from exc
+        add_symbol(parts[0])
+
+    if len(symbols) < num_atoms:
+        raise ValueError(f"Expected {num_atoms} atom lines, but found {len(symbols)}")
+
+    coordinates = np.array(values, dtype=np.float64).reshape(num_atoms, 3)
+    return list(map(sys.intern, symbols)), coordinates
+
 
 def read_xyz(file_path: str, charge: int = 0, multiplicity: int = 1) -> Structure:
     """Read an XYZ file and return a :class:`Structure` instance.
@@ -49,47 +155,23 @@ def read_xyz(file_path: str, charge: int = 0, multiplicity: int = 1) -> Structur
     if not os.path.exists(file_path):
         raise FileNotFoundError(f"File {file_path} not found")
 
-    symbols: list[str] = []
-    coordinates: list[tuple[float, float, float]] = []
-
     try:
-        with open(file_path, encoding="utf-8") as infile:
-            # Read first line: number of atoms
-            line = infile.readline()
-            try:
-                num_atoms = int(line.strip())
-            except ValueError as exc:
-                raise ValueError(
-                    "First line must contain the number of atoms as an integer"
-                ) from exc
-
-            # Read second line: comment
-            comment_line = infile.readline()
-            # If EOF is reached, comment_line is "" (which is falsy)
-            # But a blank line "\n" is truthy.
-            if not comment_line and num_atoms >= 0:
-                # We expected a comment line
-                # Note: Original code calculated found as max(0, len(lines) - 2)
-                # If we have 1 line, found = 0.
-                raise ValueError(f"Expected {num_atoms} atom lines, but found 0")
-
-            comment = comment_line.rstrip("\n")
-
-            for i in range(num_atoms):
-                line = infile.readline()
-                if not line:
-                    raise ValueError(f"Expected {num_atoms} atom lines, but found {i}")
-
-                parts = line.split()
-                if len(parts) < 4:
-                    raise ValueError(f"Line {i + 3} must contain at least 4 elements: symbol x y z")
-                symbol = parts[0]
-                try:
-                    x, y, z = float(parts[1]), float(parts[2]), float(parts[3])
-                except ValueError as exc:
-                    raise ValueError(f"Invalid coordinates in line {i + 3}: {parts[1:4]}") from exc
-                symbols.append(symbol)
-                coordinates.append((x, y, z))
+        lines = _read_lines(file_path)
+
+        # First line: number of atoms
+        first_line = lines[0].strip() if lines else ""
+        try:
+            num_atoms = int(first_line)
+        except ValueError as exc:
+            raise ValueError("First line must contain the number of atoms as an integer") from exc
+
+        # Second line: comment (may be blank, but must exist)
+        if len(lines) < 2 and num_atoms >= 0:
+            raise ValueError(f"Expected {num_atoms} atom lines, but found 0")
+
+        comment = lines[1] if len(lines) > 1 else ""
+        num_atoms = max(num_atoms, 0)
+        symbols, coordinates = _parse_atom_block(lines[2 : 2 + num_atoms], num_atoms)
 
     except Exception as exc:
         if isinstance(exc, (FileNotFoundError, ValueError)):
@@ -105,6 +187,144 @@ def read_xyz(file_path: str, charge: int = 0, multiplicity: int = 1) -> Structur
     )
 
 
+def _iter_mmap_lines(buf: mmap.mmap) -> Iterator[str]:
+    """Yield the lines of a memory-mapped UTF-8 file one at a time.
+
+    Lines are located with :meth:`mmap.mmap.find` and decoded individually, so
+    only the current line is held in memory. Each chunk up to and including
+    ``"\\n"`` is passed through :func:`_split_lines`, giving the same lines
+    as splitting the fully decoded file.
+    """
+    size = len(buf)
+    pos = 0
+    while pos < size:
+        end = buf.find(b"\n", pos)
+        end = size if end < 0 else end + 1
+        yield from _split_lines(buf[pos:end].decode("utf-8"))
+        pos = end
+
+
+def _iter_xyz_frames(
+    lines: Iterator[str], charge: int, multiplicity: int
+) -> Iterator[Structure]:
+    """Parse multi-structure XYZ lines in pure Python, one frame at a time.
+
+    Non-numeric lines between structures are skipped. Structures that are
+    truncated or contain malformed atom lines are logged and skipped.
+    """
+    for line in lines:
+        line_stripped = line.strip()
+        if not line_stripped:
+            continue
+
+        try:
+            num_atoms = int(line_stripped)
+        except ValueError:
+            continue
+
+        comment = next(lines, None)
+        if comment is None:
+            return
+
+        # Flat float64 buffer, viewed as an (N, 3) array without copying below
+        symbols: list[str] = [""] * num_atoms
+        coordinates = _ZERO_DOUBLE * (3 * num_atoms)
+
+        valid = True
+        for atom_idx in range(num_atoms):
+            atom_line = next(lines, None)
+            if atom_line is None:
+                logger.warning(
+                    "Structure '%s': unexpected end of file at atom %d/%d, skipping",
+                    comment, atom_idx + 1, num_atoms,
+                )
+                return
+
+            # At most 4 splits: columns after z stay joined in parts[4]
+            parts = atom_line.split(None, 4)
+            if len(parts) < 4:
+                logger.warning(
+                    "Structure '%s': malformed atom line %d, skipping structure",
+                    comment, atom_idx + 1,
+                )
+                valid = False
+                break
+
+            k = 3 * atom_idx
+            try:
+                coordinates[k] = float(parts[1])
+                coordinates[k + 1] = float(parts[2])
+                coordinates[k + 2] = float(parts[3])
+            except ValueError:
+                logger.warning(
+                    "Structure '%s': invalid coordinates at atom %d, skipping structure",
+                    comment, atom_idx + 1,
+                )
+                valid = False
+                break
+            symbols[atom_idx] = sys.intern(parts[0])
+
+        if valid and len(symbols) == num_atoms:
+            yield Structure(
+                symbols=symbols,
+                coordinates=np.frombuffer(coordinates).reshape(num_atoms, 3),
+                comment=comment,
+                charge=charge,
+                multiplicity=multiplicity,
+            )
+
+
+def _iter_multi_xyz_file(
+    file_path: str, charge: int, multiplicity: int
+) -> Iterator[Structure]:
+    """Yield structures from a multi-XYZ file, memory-mapping large files."""
+    with open(file_path, "rb") as fh:
+        if os.fstat(fh.fileno()).st_size < _MMAP_MIN_BYTES:
+            lines = _split_lines(fh.read().decode("utf-8"))
+            yield from _iter_xyz_frames(iter(lines), charge, multiplicity)
+            return
+
+        with mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ) as buf:
+            yield from _iter_xyz_frames(_iter_mmap_lines(buf), charge, multiplicity)
+
+
+def iter_multi_xyz(
+    file_path: str, charge: int = 0, multiplicity: int = 1
+) -> Iterator[Structure]:
+    """Iterate over the structures in a multi-structure XYZ file.
+
+    Structures are parsed and yielded one at a time, so a trajectory can be
+    processed frame by frame without holding all of it in memory. Files of
+    at least 100 MiB are memory-mapped; smaller files are read in one call.
+
+    Parameters
+    ----------
+    file_path:
+        Path to the multi-structure XYZ file.
+    charge:
+        Optional total charge to set on all returned structures (default: ``0``).
+    multiplicity:
+        Optional spin multiplicity to set (default: ``1``).
+
+    Returns
+    -------
+    Iterator[Structure]
+        Iterator over the structures in the file.
+
+    Raises
+    ------
+    FileNotFoundError
+        If the specified file does not exist.
+    UnicodeDecodeError
+        During iteration, if the file is not valid UTF-8.
+
+    """
+    if not os.path.exists(file_path):
+        raise FileNotFoundError(f"File {file_path} not found")
+
+    return _iter_multi_xyz_file(file_path, charge, multiplicity)
+
+
 def read_multi_xyz(file_path: str, charge: int = 0, multiplicity: int = 1) -> list[Structure]:
     """Read an XYZ file containing multiple structures.
 
@@ -129,83 +349,24 @@ def read_multi_xyz(file_path: str, charge: int = 0, multiplicity: int = 1) -> li
     ValueError
         If the file format is invalid.
 
+    See Also
+    --------
+    iter_multi_xyz : Read the structures lazily, one at a time.
+
     """
     if not os.path.exists(file_path):
         raise FileNotFoundError(f"File {file_path} not found")
 
-    structures: list[Structure] = []
-
     try:
-        with open(file_path, encoding="utf-8") as infile:
-            line_iterator = iter(infile)
-            while True:
-                try:
-                    line = next(line_iterator)
-                except StopIteration:
-                    break
-
-                line_stripped = line.strip()
-                if not line_stripped:
-                    continue
-
-                try:
-                    num_atoms = int(line_stripped)
-                except ValueError:
-                    continue
-
-                try:
-                    comment_line = next(line_iterator)
-                    comment = comment_line.rstrip("\n")
-                except StopIteration:
-                    break
-
-                symbols: list[str] = []
-                coordinates: list[tuple[float, float, float]] = []
-
-                valid = True
-                for atom_idx in range(num_atoms):
-                    try:
-                        atom_line = next(line_iterator)
-                    except StopIteration:
-                        logger.warning(
-                            "Structure '%s': unexpected end of file at atom %d/%d, skipping",
-                            comment, atom_idx + 1, num_atoms,
-                        )
-                        valid = False
-                        break
-
-                    parts = atom_line.split()
-                    if len(parts) < 4:
-                        logger.warning(
-                            "Structure '%s': malformed atom line %d, skipping structure",
-                            comment, atom_idx + 1,
-                        )
-                        valid = False
-                        break
-
-                    symbol = parts[0]
-                    try:
-                        x, y, z = float(parts[1]), float(parts[2]), float(parts[3])
-                    except ValueError:
-                        logger.warning(
-                            "Structure '%s': invalid coordinates at atom %d, skipping structure",
-                            comment, atom_idx + 1,
-                        )
-                        valid = False
-                        break
-                    symbols.append(symbol)
-                    coordinates.append((x, y, z))
-
-                if valid and len(symbols) == num_atoms:
-                    structures.append(
-                        Structure(
-                            symbols=symbols,
-                            coordinates=coordinates,
-                            comment=comment,
-                            charge=charge,
-                            multiplicity=multiplicity,
-                        )
-                    )
+        if _NUMBA_AVAILABLE and os.path.getsize(file_path) >= _NUMBA_MIN_BYTES:
+            with open(file_path, "rb") as fh:
+                data = fh.read()
+            structures = _parse_multi_xyz_numba(data, charge, multiplicity)
+            if structures is None:
+                lines = _split_lines(data.decode("utf-8"))
+                structures = list(_iter_xyz_frames(iter(lines), charge, multiplicity))
+        else:
+            structures = list(iter_multi_xyz(file_path, charge, multiplicity))
 
     except Exception as exc:
         raise ValueError(f"Error reading multi-XYZ file: {exc}") from exc
@@ -214,10 +375,18 @@ def read_multi_xyz(file_path: str, charge: int = 0, multiplicity: int = 1) -> li
 
 
 def read_xyz_directory(
-    directory_path: str, charge: int = 0, multiplicity: int = 1
+    directory_path: str,
+    charge: int = 0,
+    multiplicity: int = 1,
+    max_workers: int | None = None,
 ) -> list[Structure]:
     """Read all XYZ files from a directory.
 
+    Large directories are read on a thread pool so disk access of one file
+    overlaps with parsing of another. Parsing holds the GIL, so with a single
+    worker or CPU, or fewer than 64 files, the files are read serially
+    instead. Files that cannot be parsed are logged and skipped.
+
     Parameters
     ----------
     directory_path:
@@ -226,6 +395,10 @@ def read_xyz_directory(
         Optional total charge to set on all returned structures (default: ``0``).
     multiplicity:
         Optional spin multiplicity to set (default: ``1``).
+    max_workers:
+        Maximum number of reader threads. ``None`` uses the
+        :class:`~concurrent.futures.ThreadPoolExecutor` default on
+        multi-core machines; ``1`` reads serially.
 
     Returns
     -------
@@ -243,21 +416,37 @@ def read_xyz_directory(
     if not os.path.exists(directory_path):
         raise FileNotFoundError(f"Directory {directory_path} not found")
 
-    xyz_files = glob.iglob(os.path.join(directory_path, "*.xyz"))
-
-    structures: list[Structure] = []
-    found_any = False
+    # Like glob("*.xyz"): regular files (or links to them), no hidden files.
+    # A path that is not a readable directory yields no files, as with glob.
+    try:
+        with os.scandir(directory_path) as entries:
+            xyz_files = [
+                entry.path
+                for entry in entries
+                if entry.name.endswith(".xyz")
+                and not entry.name.startswith(".")
+                and entry.is_file()
+            ]
+    except (NotADirectoryError, PermissionError):
+        xyz_files = []
+    if not xyz_files:
+        raise ValueError(f"No XYZ files found in directory {directory_path}")
 
-    for xyz_file in xyz_files:
-        found_any = True
+    def _read_one(xyz_file: str) -> Structure | None:
         try:
-            structures.append(read_xyz(xyz_file, charge=charge, multiplicity=multiplicity))
+            return read_xyz(xyz_file, charge=charge, multiplicity=multiplicity)
         except Exception as exc:  # pragma: no cover - logged and skipped
             logger.warning("Failed to read %s: %s", xyz_file, exc)
+            return None
 
-    if not found_any:
-        raise ValueError(f"No XYZ files found in directory {directory_path}")
+    workers = max_workers if max_workers is not None else (os.cpu_count() or 1)
+    if workers <= 1 or len(xyz_files) < _PARALLEL_MIN_FILES:
+        results = [_read_one(xyz_file) for xyz_file in xyz_files]
+    else:
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            results = list(executor.map(_read_one, xyz_files))
 
+    structures = [struct for struct in results if struct is not None]
     if not structures:
         raise ValueError("No valid structures could be read from any XYZ files")
 
@@ -283,26 +472,36 @@ def smiles_to_xyz(
     -------
     Structure | str
         Either a :class:`Structure` or an XYZ string depending on
-        ``return_full_xyz_str``.
+        ``return_full_xyz_str``. The structure's
+        ``metadata["canonical_smiles"]`` holds the canonical form of the input.
+
+    Raises
+    ------
+    ValueError
+        If the SMILES string is empty or invalid.
+
+    Notes
+    -----
+    The structure is generated from the canonical SMILES, so atoms follow its
+    order, not the order in ``smiles_string``: ``"OCC"`` gives ``C, C, O``
+    followed by the hydrogens. Map atom indices through
+    ``metadata["canonical_smiles"]`` rather than the input string.
 
     """
     if not smiles_string or not smiles_string.strip():
         raise ValueError("SMILES string cannot be empty or None")
 
-    struct = _smiles_to_structure_util(smiles_string.strip())
+    struct = _smiles_to_structure_util(_canonical_smiles(smiles_string.strip()))
     if multiplicity is not None:
         struct.multiplicity = int(multiplicity)
 
     if return_full_xyz_str:
-        xyz_lines = [str(struct.n_atoms)]
-        xyz_lines.append(
+        comment = (
             f"Generated from SMILES using MORFEUS | "
             f"Charge: {struct.charge} | "
             f"Multiplicity: {struct.multiplicity}"
         )
-        for atom, coord in zip(struct.symbols, struct.coordinates, strict=True):
-            xyz_lines.append(f"{atom} {coord[0]:.6f} {coord[1]:.6f} {coord[2]:.6f}")
-        return "\n".join(xyz_lines)
+        return _format_xyz_block(struct, comment).rstrip("\n")
 
     struct.comment = (
         f"Generated from SMILES: {smiles_string} | "
@@ -334,7 +533,24 @@ def smiles_to_ensemble(
     Returns
     -------
     list[Structure]
-        A list of :class:`Structure` instances representing the conformers.
+        A list of :class:`Structure` instances representing the conformers,
+        each with ``metadata["canonical_smiles"]`` set.
+
+    Raises
+    ------
+    ValueError
+        If the SMILES string is empty or invalid.
+
+    Notes
+    -----
+    Conformers are generated from the canonical SMILES, so atoms follow its
+    order, not the order in ``smiles_string`` (``"OCC"`` gives ``C, C, O``
+    followed by the hydrogens).
+
+    Conformer ensembles are cached per canonical SMILES and ``seed``. With
+    ``seed=None``, repeated calls therefore return copies of the first random
+    ensemble instead of sampling a new one; call :func:`clear_smiles_cache`
+    to draw a fresh ensemble.
 
     """
     if not smiles_string or not smiles_string.strip():
@@ -342,11 +558,122 @@ def smiles_to_ensemble(
 
     mult = int(multiplicity) if multiplicity is not None else 1
     structs = _smiles_to_ensemble_util(
-        smiles_string.strip(), max_num_confs, multiplicity=mult, seed=seed,
+        _canonical_smiles(smiles_string.strip()), max_num_confs, multiplicity=mult, seed=seed,
     )
     return structs
 
 
+# Directories already created by the writers in this process
+_ensured_dirs: set[str] = set()
+
+
+def _ensure_dir(path: str) -> None:
+    """Create ``path`` (and parents) unless this process already did so.
+
+    Writing many files into the same directory then costs one set lookup per
+    file instead of an ``os.makedirs`` call. An empty path (the current
+    directory) is a no-op.
+    """
+    if not path or path in _ensured_dirs:
+        return
+    os.makedirs(path, exist_ok=True)
+    _ensured_dirs.add(path)
+
+
+def _open_for_writing(file_path: str, buffering: int = -1):
+    """Open ``file_path`` for UTF-8 text writing, creating its directory.
+
+    If the directory was removed (or the working directory changed) since it
+    was recorded in ``_ensured_dirs``, the stale entry is dropped and the
+    directory is created again.
+    """
+    parent = os.path.dirname(file_path)
+    _ensure_dir(parent)
+    try:
+        return open(file_path, "w", encoding="utf-8", buffering=buffering)
+    except FileNotFoundError:
+        if parent not in _ensured_dirs:
+            raise
+        _ensured_dirs.discard(parent)
+        _ensure_dir(parent)
+        return open(file_path, "w", encoding="utf-8", buffering=buffering)
+
+
+# Buffer size for multi-structure XYZ output
+_WRITE_BUFFER_SIZE = 1 << 20
+
+# One ``symbol x y z`` line; repeated N times and applied with a single ``%``
+# so the whole atom block is formatted in one C-level call.
+_ATOM_LINE = "%s %.6f %.6f %.6f\n"
+
+# Comment line templates: base comment, [energy,] charge, multiplicity
+_COMMENT_LINE = "%s | Charge: %s | Multiplicity: %s"
+_COMMENT_LINE_WITH_ENERGY = "%s | Energy: %.6f eV | Charge: %s | Multiplicity: %s"
+
+
+def _checked_coordinates(structure: Structure) -> np.ndarray:
+    """Return the structure's coordinates after a single shape check.
+
+    Raises
+    ------
+    ValueError
+        If the coordinates are not ``(N, 3)`` or do not match the symbols.
+
+    """
+    coords = np.asarray(structure.coordinates)
+    if coords.ndim != 2 or coords.shape[1] != 3:
+        raise ValueError(f"coordinates must have shape (N, 3), got {coords.shape}")
+    if coords.shape[0] != structure.n_atoms:
+        raise ValueError(
+            f"Structure has {structure.n_atoms} symbols but {coords.shape[0]} coordinate rows"
+        )
+    return coords
+
+
+def _format_xyz_block(structure: Structure, comment: str) -> str:
+    """Format a structure as an XYZ block (count, comment, atom lines).
+
+    Parameters
+    ----------
+    structure:
+        Structure to format.
+    comment:
+        Text for the comment line.
+
+    Returns
+    -------
+    str
+        The XYZ block, terminated by a newline.
+
+    Raises
+    ------
+    ValueError
+        If the coordinates are not ``(N, 3)`` or do not match the symbols.
+
+    """
+    n_atoms = structure.n_atoms
+    flat = _checked_coordinates(structure).ravel().tolist()
+    # Interleave into symbol, x, y, z order for the repeated template
+    values: list = [None] * (4 * n_atoms)
+    values[0::4] = structure.symbols
+    values[1::4] = flat[0::3]
+    values[2::4] = flat[1::3]
+    values[3::4] = flat[2::3]
+    atom_lines = (_ATOM_LINE * n_atoms) % tuple(values)
+    return f"{n_atoms}\n{comment}\n{atom_lines}"
+
+
+def _xyz_comment(structure: Structure, base_comment: str) -> str:
+    """Build the comment line with energy (if set), charge and multiplicity."""
+    if structure.energy is None:
+        line = _COMMENT_LINE % (base_comment, structure.charge, structure.multiplicity)
+    else:
+        line = _COMMENT_LINE_WITH_ENERGY % (
+            base_comment, structure.energy, structure.charge, structure.multiplicity
+        )
+    return line.strip()
+
+
 def save_xyz_file(structure: Structure, file_path: str) -> None:
     """Save a single :class:`Structure` to an XYZ file.
 
@@ -359,26 +686,19 @@ def save_xyz_file(structure: Structure, file_path: str) -> None:
     file_path:
         Destination file path.
 
+    Raises
+    ------
+    ValueError
+        If the structure's coordinates are not ``(N, 3)`` or do not match
+        its symbols.
+
     """
-    lines: list[str] = [str(structure.n_atoms)]
     # include existing comment and ensure energy/charge/multiplicity are visible
-    base_comment = structure.comment or ""
-    energy_part = ""
-    if structure.energy is not None:
-        energy_part = f" | Energy: {structure.energy:.6f} eV"
-    state_part = f" | Charge: {structure.charge} | Multiplicity: {structure.multiplicity}"
-    comment = (base_comment + energy_part + state_part).strip() or "Structure"
-    lines.append(comment)
-    for symbol, coord in zip(structure.symbols, structure.coordinates, strict=True):
-        lines.append(f"{symbol} {coord[0]:.6f} {coord[1]:.6f} {coord[2]:.6f}")
-
-    parent = os.path.dirname(file_path)
-    if parent:
-        os.makedirs(parent, exist_ok=True)
+    comment = _xyz_comment(structure, structure.comment or "") or "Structure"
+    block = _format_xyz_block(structure, comment)
 
-    with open(file_path, "w", encoding="utf-8") as fh:
-        fh.write("\n".join(lines))
-        fh.write("\n")
+    with _open_for_writing(file_path) as fh:
+        fh.write(block)
 
 
 def save_multi_xyz(
@@ -399,31 +719,31 @@ def save_multi_xyz(
         Optional per-structure comment strings. Falls back to each
         structure's own comment if not provided.
 
-    """
-    lines: list[str] = []
-    for idx, struct in enumerate(structures):
-        lines.append(str(struct.n_atoms))
-        base_comment = ""
-        if comments and idx < len(comments):
-            base_comment = comments[idx]
-        elif struct.comment:
-            base_comment = struct.comment
-        energy_part = ""
-        if struct.energy is not None:
-            energy_part = f" | Energy: {struct.energy:.6f} eV"
-        state_part = f" | Charge: {struct.charge} | Multiplicity: {struct.multiplicity}"
-        comment = (base_comment + energy_part + state_part).strip() or f"Structure {idx + 1}"
-        lines.append(comment)
-        for symbol, coord in zip(struct.symbols, struct.coordinates, strict=True):
-            lines.append(f"{symbol} {coord[0]:.6f} {coord[1]:.6f} {coord[2]:.6f}")
-
-    parent = os.path.dirname(file_path)
-    if parent:
-        os.makedirs(parent, exist_ok=True)
+    Raises
+    ------
+    ValueError
+        If any structure's coordinates are not ``(N, 3)`` or do not match
+        its symbols. Nothing is written in that case.
 
-    with open(file_path, "w", encoding="utf-8") as fh:
-        fh.write("\n".join(lines))
-        fh.write("\n")
+    """
+    # Check every structure up front so a bad one never leaves a partial file
+    for struct in structures:
+        _checked_coordinates(struct)
+
+    # Blocks are streamed one structure at a time; the large buffer coalesces
+    # them into few write syscalls without holding the whole file in memory.
+    with _open_for_writing(file_path, buffering=_WRITE_BUFFER_SIZE) as fh:
+        for idx, struct in enumerate(structures):
+            base_comment = ""
+            if comments and idx < len(comments):
+                base_comment = comments[idx]
+            elif struct.comment:
+                base_comment = struct.comment
+            comment = _xyz_comment(struct, base_comment) or f"Structure {idx + 1}"
+            fh.write(_format_xyz_block(struct, comment))
+        if not structures:
+            # Same output as before streaming: an empty list gives one newline
+            fh.write("\n")
 
 
 def save_as_single_xyz_files(
@@ -444,7 +764,7 @@ def save_as_single_xyz_files(
         Optional per-structure comment strings.
 
     """
-    os.makedirs(output_dir, exist_ok=True)
+    _ensure_dir(output_dir)
     width = len(str(len(structures)))
     for idx, struct in enumerate(structures):
         if comments and idx < len(comments):
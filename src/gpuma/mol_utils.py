@@ -5,8 +5,11 @@ structures and generating conformer ensembles using the :mod:`morfeus` library
 with RDKit.
 """
 
+import copy
+import functools
 from numbers import Integral
 
+import numpy as np
 from ase.data import chemical_symbols
 
 from .decorators import time_it
@@ -40,14 +43,37 @@ def _to_symbol_list(elements) -> list[str]:
     return symbols
 
 
-def _to_coord_list(coords) -> list[tuple[float, float, float]]:
-    """Convert coordinates to a nested Python list of float tuples."""
+def _to_coord_array(coords) -> np.ndarray:
+    """Convert coordinates to an ``(N, 3)`` ``float64`` array."""
+    return np.asarray(coords, dtype=np.float64).reshape(-1, 3)
+
+
+@functools.lru_cache(maxsize=4096)
+def _canonical_smiles(smiles: str) -> str:
+    """Validate a SMILES string and return its canonical, isomeric form.
+
+    Equivalent spellings of the same molecule map to one string, which is
+    used both as input for conformer generation and as cache key.
+
+    Raises
+    ------
+    ValueError
+        If the SMILES string cannot be parsed.
+    ImportError
+        If RDKit is not available.
+    """
     try:
-        if hasattr(coords, "tolist"):
-            coords = coords.tolist()
-    except (AttributeError, TypeError):  # pragma: no cover - defensive
-        pass
-    return [(float(row[0]), float(row[1]), float(row[2])) for row in coords]
+        from rdkit import Chem
+    except ImportError as exc:  # pragma: no cover - dependency error
+        raise ImportError(
+            "Required dependencies not found. Please install with: "
+            "uv pip install 'gpuma' or install 'morfeus-ml rdkit'"
+        ) from exc
+
+    mol = Chem.MolFromSmiles(smiles)
+    if mol is None:
+        raise ValueError("Invalid SMILES string")
+    return Chem.MolToSmiles(mol, canonical=True, isomericSmiles=True)
 
 
 @time_it
@@ -93,6 +119,18 @@ def smiles_to_conformer_ensemble(
     Conformers are sorted by energy (lowest first) and pruned by RMSD to remove
     duplicates. The actual number returned may be less than ``max_num_confs``.
 
+    Conformers are generated from the canonical SMILES, so atoms follow its
+    order, not the order of ``smiles``: ``"OCC"`` gives ``C, C, O`` followed
+    by the hydrogens. Map atom indices through ``metadata["canonical_smiles"]``
+    rather than the input string.
+
+    Each structure records the canonical SMILES in
+    ``metadata["canonical_smiles"]``. Generated conformers are cached per
+    canonical SMILES and ``seed``, so
+    equivalent SMILES strings (e.g. ``"OCC"`` and ``"CCO"``) share one
+    conformer search and repeated calls return copies of the cached result,
+    also when ``seed`` is ``None``. Use :func:`clear_smiles_cache` to reset.
+
     """
     if not smiles or not smiles.strip():
         raise ValueError("SMILES string cannot be empty")
@@ -100,6 +138,27 @@ def smiles_to_conformer_ensemble(
     if max_num_confs <= 0:
         raise ValueError("max_num_confs must be positive")
 
+    conformers = _generate_conformers_cached(_canonical_smiles(smiles), seed)
+
+    # Cached structures are shared; hand out independent copies
+    structures = [copy.deepcopy(struct) for idx, struct in conformers if idx < max_num_confs]
+    if not structures:
+        raise ValueError("No valid conformers could be generated from SMILES")
+
+    for struct in structures:
+        struct.multiplicity = multiplicity
+    return structures
+
+
+@functools.lru_cache(maxsize=4096)
+def _generate_conformers_cached(
+    smiles: str, seed: int | None
+) -> tuple[tuple[int, Structure], ...]:
+    """Cached conformer generation keyed on canonical SMILES and seed.
+
+    Returns ``(ensemble_index, structure)`` pairs for every valid conformer,
+    so callers can apply ``max_num_confs`` without regenerating.
+    """
     try:
         from morfeus.conformer import ConformerEnsemble  # type: ignore
         from rdkit import Chem
@@ -107,8 +166,6 @@ def smiles_to_conformer_ensemble(
         if seed is not None:
             import random
 
-            import numpy as np
-
             random.seed(seed)
             np.random.seed(seed)
 
@@ -121,33 +178,26 @@ def smiles_to_conformer_ensemble(
 
         ensemble = ConformerEnsemble.from_rdkit(mol)
         ensemble.prune_rmsd()
-        ensemble.multiplicity = multiplicity
         ensemble.sort()
 
-        structures: list[Structure] = []
+        conformers: list[tuple[int, Structure]] = []
         for i, conformer in enumerate(ensemble):
-            if i >= max_num_confs:
-                break
-
             atoms = _to_symbol_list(getattr(conformer, "elements", []))
-            coordinates = _to_coord_list(getattr(conformer, "coordinates", []))
+            coordinates = _to_coord_array(getattr(conformer, "coordinates", []))
 
             if len(atoms) != len(coordinates):
                 continue
 
-            structures.append(
-                Structure(
-                    symbols=atoms,
-                    coordinates=coordinates,
-                    charge=charge,
-                    multiplicity=ensemble.multiplicity,
-                )
+            struct = Structure(
+                symbols=atoms,
+                coordinates=coordinates,
+                charge=charge,
+                multiplicity=1,
+                metadata={"canonical_smiles": smiles},
             )
+            conformers.append((i, struct))
 
-        if not structures:
-            raise ValueError("No valid conformers could be generated from SMILES")
-
-        return structures
+        return tuple(conformers)
 
     except ImportError as exc:  # pragma: no cover - dependency error
         raise ImportError(
@@ -160,6 +210,17 @@ def smiles_to_conformer_ensemble(
         raise ValueError(f"Failed to generate conformers from SMILES '{smiles}': {exc}") from exc
 
 
+def clear_smiles_cache() -> None:
+    """Clear the cache of conformers generated from SMILES strings.
+
+    :func:`smiles_to_conformer_ensemble` (and therefore
+    :func:`smiles_to_structure`) caches generated conformers per canonical
+    SMILES and seed. Call this to free the memory or to force regeneration.
+    """
+    _generate_conformers_cached.cache_clear()
+    _canonical_smiles.cache_clear()
+
+
 def smiles_to_structure(smiles: str) -> Structure:
     """Convert a SMILES string to a single 3D molecular structure.
 
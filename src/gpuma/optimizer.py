@@ -290,7 +290,7 @@ def optimize_single_structure(
         optimizer.run(fmax=fmax)
         logger.info("Optimization completed after %d steps", optimizer.get_number_of_steps())
 
-        structure.coordinates = atoms.get_positions().tolist()
+        structure.coordinates = atoms.get_positions()
         structure.energy = float(atoms.get_potential_energy())
         return structure
 
@@ -492,7 +492,7 @@ def _optimize_batch(
     for i, atoms in enumerate(final_atoms):
         struct = Structure(
             symbols=atoms.get_chemical_symbols(),
-            coordinates=atoms.get_positions().tolist(),
+            coordinates=atoms.get_positions(),
             energy=float(final_state.energy[i].item()),
             charge=int(final_state.charge[i].item()),
             multiplicity=int(final_state.spin[i].item()),
@@ -3,17 +3,26 @@
 from dataclasses import dataclass, field
 from typing import Any
 
+import numpy as np
 
-@dataclass
+
+@dataclass(slots=True, kw_only=True)
 class Structure:
     """Container for a molecular structure used in GPUMA.
 
+    Coordinates are stored as a single contiguous ``(N, 3)`` ``float64`` array
+    rather than a list of tuples, so ASE and torch-sim can consume them without
+    re-packing. Sequences of triples are converted on construction.
+
+    Instances use ``__slots__`` (no per-instance ``__dict__``) to keep large
+    ensembles and trajectories compact, and all fields are keyword-only.
+
     Attributes
     ----------
     symbols : list[str]
         List of atomic symbols.
-    coordinates : list[tuple[float, float, float]]
-        ``N x 3`` list of floats for atomic positions in Angstrom.
+    coordinates : numpy.ndarray
+        ``(N, 3)`` array of atomic positions in Angstrom.
     charge : int
         Total charge of the system.
     multiplicity : int
@@ -27,7 +36,7 @@ class Structure:
     """
 
     symbols: list[str]
-    coordinates: list[tuple[float, float, float]]
+    coordinates: np.ndarray
     charge: int
     multiplicity: int
     energy: float | None = None
@@ -36,6 +45,31 @@ class Structure:
     # Room for future metadata without breaking the public API
     metadata: dict[str, Any] = field(default_factory=dict)
 
+    # (symbols, coordinates, charge, smiles) the cached SMILES was derived from
+    _smiles_cache: tuple[list[str], np.ndarray, int, str] | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
+    def __eq__(self, other: object) -> bool:
+        # The generated __eq__ would compare coordinate arrays with ``==``,
+        # whose result has no single truth value
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+        return (
+            self.symbols == other.symbols
+            and np.array_equal(self.coordinates, other.coordinates)
+            and self.charge == other.charge
+            and self.multiplicity == other.multiplicity
+            and self.energy == other.energy
+            and self.comment == other.comment
+            and self.metadata == other.metadata
+        )
+
+    def __post_init__(self) -> None:
+        if isinstance(self.symbols, np.ndarray):
+            self.symbols = self.symbols.tolist()
+        self.coordinates = _as_coordinate_array(self.coordinates)
+
     @property
     def n_atoms(self) -> int:
         """Return the number of atoms in the structure.
@@ -47,6 +81,39 @@ class Structure:
         """
         return len(self.symbols)
 
+    def canonical_smiles(self) -> str:
+        """Return the canonical isomeric SMILES of the structure.
+
+        Bonds are perceived from the 3D coordinates with RDKit's
+        ``rdDetermineBonds`` using the total charge. The result is cached on
+        the instance; assigning new ``symbols``, ``coordinates`` or ``charge``
+        invalidates it, in-place edits of those objects do not.
+
+        Returns
+        -------
+        str
+            Canonical isomeric SMILES without explicit hydrogens.
+
+        Raises
+        ------
+        ValueError
+            If no bonding pattern consistent with the charge can be found.
+        ImportError
+            If RDKit is not available.
+        """
+        cache = self._smiles_cache
+        if (
+            cache is not None
+            and cache[0] is self.symbols
+            and cache[1] is self.coordinates
+            and cache[2] == self.charge
+        ):
+            return cache[3]
+
+        smiles = _smiles_from_xyz(self.symbols, self.coordinates, self.charge)
+        self._smiles_cache = (self.symbols, self.coordinates, self.charge, smiles)
+        return smiles
+
     def with_energy(self, energy: float | None) -> "Structure":
         """Set the energy of the structure and return the modified instance.
 
@@ -63,3 +130,50 @@ class Structure:
         """
         self.energy = energy
         return self
+
+
+def _smiles_from_xyz(symbols: list[str], coordinates: np.ndarray, charge: int) -> str:
+    """Perceive bonds from 3D coordinates and return the canonical SMILES."""
+    try:
+        from rdkit import Chem
+        from rdkit.Chem import rdDetermineBonds
+    except ImportError as exc:  # pragma: no cover - dependency error
+        raise ImportError(
+            "Required dependencies not found. Please install with: "
+            "uv pip install 'gpuma' or install 'rdkit'"
+        ) from exc
+
+    lines = [str(len(symbols)), ""]
+    lines += [
+        f"{s} {x:.8f} {y:.8f} {z:.8f}"
+        for s, (x, y, z) in zip(symbols, coordinates.tolist(), strict=True)
+    ]
+    mol = Chem.MolFromXYZBlock("\n".join(lines) + "\n")
+    if mol is None:
+        raise ValueError("Could not build an RDKit molecule from the structure")
+
+    try:
+        rdDetermineBonds.DetermineBonds(mol, charge=charge)
+    except Exception as exc:
+        raise ValueError(f"Could not determine bonds from coordinates: {exc}") from exc
+
+    Chem.AssignStereochemistryFrom3D(mol)
+    return Chem.MolToSmiles(Chem.RemoveHs(mol), canonical=True, isomericSmiles=True)
+
+
+def _as_coordinate_array(coordinates: Any) -> np.ndarray:
+    """Return ``coordinates`` as an ``(N, 3)`` ``float64`` array.
+
+    Existing ``float64`` arrays are returned without copying.
+
+    Raises
+    ------
+    ValueError
+        If the input cannot be interpreted as ``N x 3`` coordinates.
+    """
+    coords = np.asarray(coordinates, dtype=np.float64)
+    if coords.size == 0:
+        return coords.reshape(0, 3)
+    if coords.ndim != 2 or coords.shape[1] != 3:
+        raise ValueError(f"coordinates must have shape (N, 3), got {coords.shape}")
+    return coords
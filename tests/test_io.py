@@ -1,8 +1,14 @@
 """Tests for I/O functions — uses real test data files and real RDKit/morfeus."""
 
+import warnings
+
+import numpy as np
 import pytest
 
 from gpuma.io_handler import (
+    _iter_xyz_frames,
+    _split_lines,
+    iter_multi_xyz,
     read_multi_xyz,
     read_xyz,
     read_xyz_directory,
@@ -12,6 +18,7 @@ from gpuma.io_handler import (
     smiles_to_ensemble,
     smiles_to_xyz,
 )
+from gpuma.mol_utils import clear_smiles_cache
 from gpuma.structure import Structure
 
 from conftest import (
@@ -72,6 +79,28 @@ def test_read_xyz_malformed(tmp_path):
         read_xyz(str(bad))
 
 
+def test_read_xyz_missing_atom_lines(tmp_path):
+    """A header-only file raises ValueError without emitting warnings."""
+    f = tmp_path / "header_only.xyz"
+    f.write_text("2\n\n")
+    with warnings.catch_warnings():
+        warnings.simplefilter("error")
+        with pytest.raises(ValueError, match="Expected 2 atom lines, but found 0"):
+            read_xyz(str(f))
+
+
+def test_read_xyz_extra_columns_and_bad_coordinates(tmp_path):
+    """Columns after z are ignored; coordinates must each be a single number."""
+    f = tmp_path / "extra.xyz"
+    f.write_text("2\nc\nO 0 0 0 8 x\nH 1.5 -2 3e-1\n")
+    s = read_xyz(str(f))
+    assert s.coordinates.tolist() == [[0.0, 0.0, 0.0], [1.5, -2.0, 0.3]]
+
+    f.write_text("2\nc\nO 0 1-2 0\nH 1 2\n")
+    with pytest.raises(ValueError):
+        read_xyz(str(f))
+
+
 # ---------------------------------------------------------------------------
 # read_multi_xyz
 # ---------------------------------------------------------------------------
@@ -111,6 +140,82 @@ def test_read_multi_xyz_malformed_skips(tmp_path):
     assert structures[0].n_atoms == 3
 
 
+def test_iter_multi_xyz_matches_read(monkeypatch):
+    """The lazy iterator yields the same structures, also when memory-mapped."""
+    import gpuma.io_handler as io_handler
+
+    expected = read_multi_xyz(str(SMALL_BATCH_XYZ))
+    it = iter_multi_xyz(str(SMALL_BATCH_XYZ))
+    assert isinstance(next(it), Structure)
+
+    monkeypatch.setattr(io_handler, "_MMAP_MIN_BYTES", 0)
+    mapped = list(iter_multi_xyz(str(SMALL_BATCH_XYZ)))
+    assert len(mapped) == len(expected)
+    for a, b in zip(mapped, expected, strict=True):
+        assert a.symbols == b.symbols
+        assert a.comment == b.comment
+        assert np.array_equal(a.coordinates, b.coordinates)
+
+
+def test_iter_multi_xyz_missing_file():
+    """A missing file is reported when the iterator is created."""
+    with pytest.raises(FileNotFoundError):
+        iter_multi_xyz("/nonexistent/file.xyz")
+
+
+def test_read_multi_xyz_numba_matches_python():
+    """The optional Numba parser matches the Python path; frames own their coordinates."""
+    pytest.importorskip("numba")
+    from gpuma._xyz_numba import parse_multi_xyz
+
+    data = SMALL_BATCH_XYZ.read_bytes()
+    fast = parse_multi_xyz(data, 0, 1)
+    slow = list(_iter_xyz_frames(iter(_split_lines(data.decode("utf-8"))), 0, 1))
+    assert fast is not None
+    assert len(fast) == len(slow)
+    assert not np.shares_memory(fast[0].coordinates, fast[1].coordinates)
+    for a, b in zip(fast, slow, strict=True):
+        assert a.symbols == b.symbols
+        assert a.comment == b.comment
+        assert np.array_equal(a.coordinates, b.coordinates)
+
+
+def test_read_multi_xyz_numba_defers_malformed():
+    """Files needing skip-and-warn recovery are left to the Python path."""
+    pytest.importorskip("numba")
+    from gpuma._xyz_numba import parse_multi_xyz
+
+    assert parse_multi_xyz(b"3\nWater\nO 0 0 0\nH 1 0 0\nH 0 1 0\n999\nBad\n", 0, 1) is None
+
+
+
+@pytest.mark.parametrize("separator", ["\x0c", "\x85", "\u2028"])
+def test_readers_keep_separators_in_comments(tmp_path, separator):
+    """Only \\n, \\r\\n and \\r end lines; other separators stay in the comment."""
+    comment = f"c{separator}more"
+    f = tmp_path / "sep.xyz"
+    f.write_bytes(f"2\n{comment}\r\nO 0 0 0\nH 1 2 3\n".encode())
+
+    s = read_xyz(str(f))
+    assert s.comment == comment
+    assert s.coordinates.tolist() == [[0.0, 0.0, 0.0], [1.0, 2.0, 3.0]]
+
+    structures = read_multi_xyz(str(f))
+    assert [m.comment for m in structures] == [comment]
+    assert list(iter_multi_xyz(str(f)))[0].comment == comment
+
+
+def test_read_multi_xyz_numba_keeps_separators_in_comments():
+    """The Numba parser treats comment separators like the Python path."""
+    pytest.importorskip("numba")
+    from gpuma._xyz_numba import parse_multi_xyz
+
+    structures = parse_multi_xyz("1\nc\x0cd\u2028e\nH\x0c0 0 0\n".encode(), 0, 1)
+    assert structures is not None
+    assert structures[0].comment == "c\x0cd\u2028e"
+    assert structures[0].coordinates.tolist() == [[0.0, 0.0, 0.0]]
+
+
 # ---------------------------------------------------------------------------
 # read_xyz_directory
 # ---------------------------------------------------------------------------
@@ -124,6 +229,45 @@ def test_read_xyz_directory():
         assert s.n_atoms > 0
 
 
+def test_read_xyz_directory_skips_invalid(tmp_path):
+    """Unreadable files are skipped; valid files are still returned."""
+    (tmp_path / "a.xyz").write_text("1\nA\nH 0 0 0\n")
+    (tmp_path / "b.xyz").write_text("not_a_number\n")
+    (tmp_path / "c.xyz").write_text("2\nC\nH 0 0 0\nH 0 0 0.74\n")
+    structures = read_xyz_directory(str(tmp_path), max_workers=2)
+    assert sorted(s.comment for s in structures) == ["A", "C"]
+
+
+def test_read_xyz_directory_thread_pool(tmp_path, monkeypatch):
+    """The thread-pool path returns the same structures as serial reading."""
+    import gpuma.io_handler as io_handler
+
+    for i in range(4):
+        (tmp_path / f"{i}.xyz").write_text(f"1\nS{i}\nH 0 0 {i}\n")
+    serial = read_xyz_directory(str(tmp_path), max_workers=1)
+    monkeypatch.setattr(io_handler, "_PARALLEL_MIN_FILES", 0)
+    pooled = read_xyz_directory(str(tmp_path), max_workers=2)
+    assert pooled == serial
+
+
+def test_read_xyz_directory_ignores_non_files(tmp_path):
+    """Subdirectories, hidden files and other extensions are not read."""
+    (tmp_path / "a.xyz").write_text("1\nA\nH 0 0 0\n")
+    (tmp_path / ".hidden.xyz").write_text("1\nHidden\nH 0 0 0\n")
+    (tmp_path / "notes.txt").write_text("1\nTxt\nH 0 0 0\n")
+    (tmp_path / "sub.xyz").mkdir()
+    structures = read_xyz_directory(str(tmp_path))
+    assert [s.comment for s in structures] == ["A"]
+
+
+def test_read_xyz_directory_not_a_directory(tmp_path):
+    """A file path raises the documented ValueError, not NotADirectoryError."""
+    f = tmp_path / "a.xyz"
+    f.write_text("1\nA\nH 0 0 0\n")
+    with pytest.raises(ValueError, match="No XYZ files found"):
+        read_xyz_directory(str(f))
+
+
 def test_read_xyz_directory_not_found():
     """Missing directory raises FileNotFoundError."""
     with pytest.raises(FileNotFoundError):
@@ -148,6 +292,36 @@ def test_save_xyz_file(tmp_path, methane):
     assert "Charge: 0" in content
 
 
+def test_save_xyz_file_atom_lines(tmp_path, methane):
+    """Atom lines are written as 'symbol x y z' with six decimals."""
+    out = tmp_path / "out.xyz"
+    save_xyz_file(methane, str(out))
+
+    lines = out.read_text().splitlines()
+    assert len(lines) == 2 + methane.n_atoms
+    assert lines[2] == "C 0.000000 0.000000 0.000000"
+    assert lines[3] == "H 0.630000 0.630000 0.630000"
+
+
+def test_save_xyz_file_mismatched_coordinates(tmp_path):
+    """Symbols and coordinate rows of different length raise ValueError."""
+    bad = Structure(symbols=["H", "H"], coordinates=[(0.0, 0.0, 0.0)], charge=0, multiplicity=1)
+    with pytest.raises(ValueError):
+        save_xyz_file(bad, str(tmp_path / "bad.xyz"))
+    assert not (tmp_path / "bad.xyz").exists()
+
+
+def test_save_xyz_file_recreates_removed_dir(tmp_path, methane):
+    """A directory removed after a previous save is created again."""
+    out_dir = tmp_path / "out"
+    save_xyz_file(methane, str(out_dir / "a.xyz"))
+    (out_dir / "a.xyz").unlink()
+    out_dir.rmdir()
+
+    save_xyz_file(methane, str(out_dir / "b.xyz"))
+    assert (out_dir / "b.xyz").exists()
+
+
 def test_save_xyz_permission_error(methane):
     """Writing to a read-only path raises PermissionError."""
     with pytest.raises(PermissionError):
@@ -159,6 +333,13 @@ def test_save_xyz_permission_error(methane):
 # ---------------------------------------------------------------------------
 
 
+def test_save_multi_xyz_empty_list(tmp_path):
+    """An empty structure list writes a single newline."""
+    out = tmp_path / "empty.xyz"
+    save_multi_xyz([], str(out))
+    assert out.read_text() == "\n"
+
+
 def test_save_multi_xyz(tmp_path, methane, ethanol):
     """Multi-XYZ output contains one block per structure."""
     out = tmp_path / "multi.xyz"
@@ -235,6 +416,41 @@ def test_smiles_to_xyz_with_multiplicity():
     assert s.multiplicity == 3
 
 
+def test_smiles_to_xyz_canonical_metadata():
+    """The canonical SMILES is recorded on the structure."""
+    s = smiles_to_xyz(" OCC ")
+    assert s.metadata["canonical_smiles"] == "CCO"
+
+
+def test_smiles_to_xyz_canonical_atom_order():
+    """Atoms follow the canonical SMILES, not the input spelling."""
+    s = smiles_to_xyz("OCC")
+    assert s.symbols[:3] == ["C", "C", "O"]
+    assert s.symbols == smiles_to_xyz("CCO").symbols
+    ensemble = smiles_to_ensemble("OCC", max_num_confs=1, seed=42)
+    assert ensemble[0].symbols[:3] == ["C", "C", "O"]
+
+
+def test_smiles_to_xyz_invalid():
+    """Unparseable SMILES raise ValueError before any conformer search."""
+    with pytest.raises(ValueError):
+        smiles_to_xyz("C1CC")
+
+
+def test_smiles_to_xyz_cached_copies():
+    """Repeated and equivalent SMILES reuse the cache but return independent copies."""
+    clear_smiles_cache()
+    first = smiles_to_xyz("CCO")
+    second = smiles_to_xyz("OCC")
+    assert first is not second
+    assert first.symbols == second.symbols
+    assert np.array_equal(first.coordinates, second.coordinates)
+
+    first.coordinates[0, 0] += 1.0
+    third = smiles_to_xyz("CCO")
+    assert np.array_equal(third.coordinates, second.coordinates)
+
+
 # ---------------------------------------------------------------------------
 # Round-trip: write -> read -> verify
 # ---------------------------------------------------------------------------
@@ -1,5 +1,8 @@
 """Tests for the Structure dataclass."""
 
+import numpy as np
+import pytest
+
 from gpuma.structure import Structure
 
 
@@ -41,3 +44,61 @@ def test_structure_metadata():
         metadata={"source": "test"},
     )
     assert s.metadata["source"] == "test"
+
+
+def test_structure_coordinates_array(methane):
+    """Coordinate sequences are stored as an (N, 3) float64 array."""
+    assert isinstance(methane.coordinates, np.ndarray)
+    assert methane.coordinates.shape == (5, 3)
+    assert methane.coordinates.dtype == np.float64
+
+
+def test_structure_coordinates_no_copy():
+    """An existing float64 array is stored without copying."""
+    coords = np.zeros((2, 3))
+    s = Structure(symbols=["H", "H"], coordinates=coords, charge=0, multiplicity=1)
+    assert s.coordinates is coords
+
+
+def test_structure_invalid_coordinates():
+    """Coordinates that are not N x 3 raise ValueError."""
+    with pytest.raises(ValueError):
+        Structure(symbols=["H"], coordinates=[(0.0, 0.0)], charge=0, multiplicity=2)
+
+
+def test_structure_slots_and_keyword_only(methane):
+    """Structure has no per-instance __dict__ and rejects positional arguments."""
+    assert not hasattr(methane, "__dict__")
+    with pytest.raises(TypeError):
+        Structure(["H"], [(0.0, 0.0, 0.0)], 0, 2)
+
+
+def test_structure_canonical_smiles_cached(ethanol):
+    """canonical_smiles() perceives bonds once and is reset by reassignment."""
+    assert ethanol.canonical_smiles() == "CCO"
+    cached = ethanol._smiles_cache
+    assert ethanol.canonical_smiles() == "CCO"
+    assert ethanol._smiles_cache is cached
+
+    ethanol.coordinates = ethanol.coordinates.copy()
+    assert ethanol.canonical_smiles() == "CCO"
+    assert ethanol._smiles_cache is not cached
+    assert "_smiles_cache" not in repr(ethanol)
+
+
+def test_structure_equality():
+    """Structures compare by value, including their coordinate arrays."""
+    def h2(bond_length):
+        return Structure(
+            symbols=["H", "H"],
+            coordinates=[(0.0, 0.0, 0.0), (0.0, 0.0, bond_length)],
+            charge=0,
+            multiplicity=1,
+        )
+
+    a, b, c = h2(0.74), h2(0.74), h2(0.75)
+    assert a == b
+    assert a != c
+    assert b in [c, a]
+    assert c not in [a]
+    assert a != "H2"